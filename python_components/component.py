@@ -1,7 +1,16 @@
 """Component base class for lifecycle management."""
 
+import sys
 from abc import ABC, abstractmethod
-from typing import final
+from typing import TYPE_CHECKING, final
+
+if TYPE_CHECKING:
+    from python_components.system import System
+
+
+def _intern(name: str) -> str:
+    """Intern a component name, leaving str subclasses such as StrEnum as is."""
+    return sys.intern(name) if type(name) is str else name
 
 
 class Component(ABC):
@@ -14,8 +23,6 @@ class Component(ABC):
 
     def __init__(self):
         """Initialize a component with an empty dependency list."""
-        from python_components import System
-
         self.system: System
         self.dependencies: list[str] = []
 
@@ -43,7 +50,9 @@ class Component(ABC):
 
         Args:
             dependencies: List of component names (keys in the system map)
-                         that this component depends on.
+                         that this component depends on. Duplicates are
+                         dropped, keeping the first occurrence, and names
+                         are interned to speed up lookups in the system map.
 
         Returns:
             Self, to allow method chaining.
@@ -52,7 +61,7 @@ class Component(ABC):
             >>> cache = Cache().using(["database"])
             >>> api = ApiService().using(["database", "cache"])
         """
-        self.dependencies = dependencies
+        self.dependencies = list(dict.fromkeys(map(_intern, dependencies)))
         return self
 
 
@@ -1,60 +1,208 @@
 """System class for managing component lifecycle and dependencies."""
 
-from python_components.component import Component
-from networkx import DiGraph, topological_sort, NetworkXUnfeasible
+from array import array
+from collections import deque
+from collections.abc import Callable
+
+from python_components.component import Component, _intern
 
 
 class System(Component):
     """A system manages the lifecycle of multiple components with dependencies."""
 
-    def __init__(self, system_map: dict[str, Component]):
+    def __init__(self, system_map: dict[str, Component], max_workers: int = 1):
+        """Initialize a system from a map of component names to components.
+
+        Component dependencies are resolved and sorted here, so missing
+        dependencies and cycles are reported when the system is built and
+        start() and shutdown() only iterate the precomputed order.
+
+        Args:
+            system_map: Mapping of component names to components.
+            max_workers: Maximum number of threads used to start and shut down
+                         independent components concurrently. Defaults to 1,
+                         which runs every component on the calling thread.
+
+        Raises:
+            KeyError: If a component depends on a name missing from the system map.
+            ValueError: If the dependency graph has cycles, or if max_workers
+                        is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
         super().__init__()
         self.system_map = system_map
+        self.max_workers = max_workers
         self.state: str = "INITIALIZED"
+        self.invalidate()
+
+    def invalidate(self):
+        """Rebuild the dependency graph and recompute the initialization order.
+
+        Call this after mutating the system map or any component's dependencies,
+        otherwise start() and shutdown() keep using the order validated before.
+        If the rebuild fails, the previous graph and order are kept.
+
+        Raises:
+            KeyError: If a component depends on a name missing from the system map.
+            ValueError: If the dependency graph has cycles.
+        """
+        components, deps_idx, dependents_idx, indeg = self._index_components()
+        init_order = _sort_components(components, indeg, dependents_idx)
+
+        self._components = components
+        self._deps_idx = deps_idx
+        self._dependents_idx = dependents_idx
+        self._indeg = indeg
+        self._init_order = init_order
 
     def start(self, system: "System"):
-        """Start all components in dependency order."""
-        init_order = self.initialization_order()
-        for component in init_order:
-            component.start(self)
+        """Start all components in dependency order.
+
+        By default components start one by one on the calling thread. With
+        max_workers > 1, each component is started on a thread pool as soon as
+        all of its dependencies have started, so independent components start
+        concurrently. The first error raised by a component is propagated;
+        components already running finish, but no further ones are started.
+        """
+        if self.max_workers == 1:
+            for component in self._init_order:
+                component.start(self)
+        else:
+            self._run_in_dependency_order(
+                lambda component: component.start(self),
+                array("i", self._indeg),
+                self._dependents_idx,
+            )
         self.state = "STARTED"
 
     def shutdown(self):
-        """Shutdown all components in reverse dependency order."""
-        init_order = self.initialization_order()
-        init_order.reverse()
-        for component in init_order:
-            component.shutdown()
+        """Shutdown all components in reverse dependency order.
+
+        By default the shutdown order is exactly the reverse of the
+        initialization order, on the calling thread. With max_workers > 1, each
+        component is shut down on a thread pool as soon as every component
+        depending on it has shut down.
+        """
+        if self.max_workers == 1:
+            for component in reversed(self._init_order):
+                component.shutdown()
+        else:
+            self._run_in_dependency_order(
+                lambda component: component.shutdown(),
+                array("i", map(len, self._dependents_idx)),
+                self._deps_idx,
+            )
         self.state = "TERMINATED"
 
-    def system_map_to_graph(self):
-        """Convert the system map to a directed graph for dependency analysis."""
-        graph = DiGraph()
+    def _run_in_dependency_order(
+        self,
+        action: Callable[[Component], object],
+        blockers: array,
+        unblocks: list[list[int]],
+    ):
+        """Run an action on every component as soon as it is unblocked.
+
+        At most max_workers actions are submitted at a time, so when one fails
+        nothing is left queued in the executor: running actions finish and no
+        further ones are started.
+
+        Args:
+            action: Called with each component on a worker thread.
+            blockers: Number of actions each component waits on. Decremented
+                      in place as those actions complete.
+            unblocks: For each component, the components waiting on it.
+        """
+        # concurrent.futures pulls in logging; import it only when needed.
+        from concurrent.futures import (
+            FIRST_COMPLETED,
+            Future,
+            ThreadPoolExecutor,
+            wait,
+        )
+
+        components = self._components
+        ready = deque(i for i, count in enumerate(blockers) if count == 0)
+        pending: dict[Future, int] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while ready or pending:
+                while ready and len(pending) < self.max_workers:
+                    i = ready.popleft()
+                    pending[executor.submit(action, components[i])] = i
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finished = pending.pop(future)
+                    future.result()
+                    for waiting in unblocks[finished]:
+                        blockers[waiting] -= 1
+                        if blockers[waiting] == 0:
+                            ready.append(waiting)
+
+    def system_map_to_graph(self) -> dict[Component, list[Component]]:
+        """Convert the system map to an adjacency mapping for dependency analysis.
+
+        Each component is mapped to the list of components it depends on.
+        """
+        components = self._components
+        return {
+            components[i]: [components[dep] for dep in deps]
+            for i, deps in enumerate(self._deps_idx)
+        }
 
-        for component in self.system_map.values():
-            graph.add_node(component)
+    def _index_components(
+        self,
+    ) -> tuple[list[Component], list[list[int]], list[list[int]], array]:
+        """Build the integer-indexed dependency graph of the system map.
+
+        Components get ids in system-map order and the graph is returned as
+        parallel lists indexed by id: the component, the ids it depends on,
+        the ids depending on it, and its in-degree. A component registered
+        under several names gets a single id, so it is started only once.
+        """
+        components: list[Component] = []
+        ids: dict[int, int] = {}
+        index: dict[str, int] = {}
+        for name, component in self.system_map.items():
+            i = ids.get(id(component))
+            if i is None:
+                i = ids[id(component)] = len(components)
+                components.append(component)
+            # Interned keys let lookups of interned dependency names match by
+            # identity.
+            index[_intern(name)] = i
+        deps_idx: list[list[int]] = []
+        dependents_idx: list[list[int]] = [[] for _ in components]
+
+        for i, component in enumerate(components):
+            deps = []
             for dependency in component.dependencies:
-                try:
-                    component_dep = self.system_map[dependency]
-                except KeyError as ke:
+                dep_id = index.get(dependency)
+                if dep_id is None:
                     raise KeyError(
                         f"Component dependency '{dependency}' not found in system map"
-                    ) from ke
+                    )
 
-                graph.add_edge(component, component_dep)
-        return graph
+                # Aliases of one component resolve to the same id; keep one edge.
+                if dep_id in deps:
+                    continue
 
-    def initialization_order(self):
-        """Determine the order in which components should be initialized."""
-        graph = self.system_map_to_graph()
-        try:
-            components_list = list(topological_sort(graph))
-            components_list.reverse()
-            return components_list
-        except NetworkXUnfeasible:
-            raise ValueError(
-                "Dependency graph has cycles; cannot determine initialization order."
-            )
+                deps.append(dep_id)
+                dependents_idx[dep_id].append(i)
+            deps_idx.append(deps)
+
+        indeg = array("i", [len(deps) for deps in deps_idx])
+        return components, deps_idx, dependents_idx, indeg
+
+    def initialization_order(self) -> list[Component]:
+        """Return the order in which components are initialized.
+
+        The order is computed and checked for cycles when the system is built
+        and cached until invalidate() is called. A copy is returned, so
+        mutating it does not affect start() or shutdown().
+        """
+        return list(self._init_order)
 
     def get_component(self, name: str) -> Component:
         """Retrieve a component by its name from the system map."""
@@ -64,6 +212,59 @@ class System(Component):
             raise KeyError(f"Component '{name}' not found in system map") from ke
 
 
+def _sort_components(
+    components: list[Component], indeg: array, dependents: list[list[int]]
+) -> list[Component]:
+    """Sort components topologically into an initialization order."""
+    if not any(indeg):
+        # Without dependencies any order is valid.
+        return list(components)
+
+    order = _toposort(indeg, dependents)
+    if len(order) != len(components):
+        raise ValueError(
+            "Dependency graph has cycles; cannot determine initialization order."
+        )
+
+    return [components[i] for i in order]
+
+
+def _toposort(indeg: array, dependents: list[list[int]]) -> list[int]:
+    """Run Kahn's algorithm over an integer-indexed graph.
+
+    Args:
+        indeg: In-degree of every node. It is copied, not modified.
+        dependents: For every node, the nodes that depend on it.
+
+    Returns:
+        The sorted node ids. On a cycle the ids are short: nodes on or behind
+        a cycle never reach in-degree zero.
+    """
+    # The order list is preallocated and doubles as the queue: ids are written
+    # at w once their in-degree drops to zero and read back at head.
+    in_degree = array("i", indeg)
+    order = [0] * len(in_degree)
+    w = 0
+
+    for i, degree in enumerate(in_degree):
+        if degree == 0:
+            order[w] = i
+            w += 1
+
+    head = 0
+    while head < w:
+        current = order[head]
+        head += 1
+        for dependent in dependents[current]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                order[w] = dependent
+                w += 1
+
+    del order[w:]
+    return order
+
+
 """
 Copyright (c) 2025 Lucas Sant'Anna
 
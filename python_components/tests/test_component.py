@@ -1,5 +1,8 @@
 """Tests for the Component class."""
 
+import sys
+from enum import StrEnum
+
 from python_components.component import Component
 
 
@@ -32,6 +35,30 @@ def test_component_using():
     assert component.dependencies == ["dependency1", "dependency2"]
 
 
+def test_component_using_deduplicates():
+    """Test that duplicate dependencies are dropped while preserving order."""
+    component = MockComponent().using(["dep2", "dep1", "dep2", "dep1"])
+    assert component.dependencies == ["dep2", "dep1"]
+
+
+def test_component_using_interns_names():
+    """Test that dependency names are interned."""
+    # Built at runtime so it is a distinct object from any interned literal.
+    name = "DEPENDENCY".lower()
+    component = MockComponent().using([name])
+    assert component.dependencies[0] is sys.intern(name)
+
+
+def test_component_using_accepts_str_subclasses():
+    """Test that str subclasses such as StrEnum members are accepted as names."""
+
+    class Names(StrEnum):
+        DB = "db"
+
+    component = MockComponent().using([Names.DB, "db"])
+    assert component.dependencies == [Names.DB]
+
+
 def test_component_using_returns_self():
     """Test that using() returns the component instance for method chaining."""
     component = MockComponent()
@@ -1,5 +1,9 @@
 """Tests for the System class."""
 
+import itertools
+import threading
+from enum import StrEnum
+
 import pytest
 from python_components.component import Component
 from python_components.system import System
@@ -67,9 +71,13 @@ def test_system_shuts_down_components():
     assert system.state == "TERMINATED"
 
 
-def test_system_dependency_order():
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_system_dependency_order(max_workers):
     """Test that components are started in dependency order."""
-    start_sequence = []
+    # Slots are claimed through a shared counter, so starts running on pool
+    # threads record their order without appending to a shared list.
+    start_sequence = [None] * 4
+    counter = itertools.count()
 
     class OrderedComponent(Component):
         def __init__(self, name: str):
@@ -77,7 +85,7 @@ def test_system_dependency_order():
             self.name = name
 
         def start(self, system: Component):
-            start_sequence.append(self.name)
+            start_sequence[next(counter)] = self.name
 
         def shutdown(self):
             pass
@@ -94,7 +102,7 @@ def test_system_dependency_order():
         "comp4": comp4,
     }
 
-    system = System(system_map)
+    system = System(system_map, max_workers=max_workers)
     system.start(system)
 
     # comp1 should start first (no dependencies)
@@ -108,9 +116,11 @@ def test_system_dependency_order():
     assert start_sequence[3] == "comp4"
 
 
-def test_system_shutdown_reverse_order():
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_system_shutdown_reverse_order(max_workers):
     """Test that components are shut down in reverse dependency order."""
-    shutdown_sequence = []
+    shutdown_sequence = [None] * 3
+    counter = itertools.count()
 
     class OrderedComponent(Component):
         def __init__(self, name: str):
@@ -121,7 +131,7 @@ def test_system_shutdown_reverse_order():
             pass
 
         def shutdown(self):
-            shutdown_sequence.append(self.name)
+            shutdown_sequence[next(counter)] = self.name
 
     comp1 = OrderedComponent("comp1")
     comp2 = OrderedComponent("comp2").using(["comp1"])
@@ -133,7 +143,7 @@ def test_system_shutdown_reverse_order():
         "comp3": comp3,
     }
 
-    system = System(system_map)
+    system = System(system_map, max_workers=max_workers)
     system.start(system)
     system.shutdown()
 
@@ -141,19 +151,293 @@ def test_system_shutdown_reverse_order():
     assert shutdown_sequence == ["comp3", "comp2", "comp1"]
 
 
+def test_system_initialization_order_is_cached():
+    """Test that the cached initialization order cannot be mutated by callers."""
+    comp1 = MockLifecycleComponent("comp1")
+    comp2 = MockLifecycleComponent("comp2").using(["comp1"])
+
+    system = System({"comp1": comp1, "comp2": comp2})
+    init_order = system.initialization_order()
+
+    assert init_order == [comp1, comp2]
+
+    init_order.clear()
+    assert system.initialization_order() == [comp1, comp2]
+
+    system.start(system)
+    assert comp1.started is True
+    assert comp2.started is True
+
+    system.shutdown()
+
+    # shutdown() must not mutate the cached order
+    assert system.initialization_order() == [comp1, comp2]
+
+
+def test_system_invalidate_recomputes_order():
+    """Test that invalidate() picks up dependency changes."""
+    comp1 = MockLifecycleComponent("comp1")
+    comp2 = MockLifecycleComponent("comp2")
+
+    system = System({"comp1": comp1, "comp2": comp2})
+    assert system.initialization_order() == [comp1, comp2]
+
+    comp1.using(["comp2"])
+    assert system.initialization_order() == [comp1, comp2]
+
+    system.invalidate()
+    assert system.initialization_order() == [comp2, comp1]
+
+    system.system_map["comp3"] = MockLifecycleComponent("comp3").using(["missing"])
+    with pytest.raises(KeyError, match="Component dependency 'missing' not found"):
+        system.invalidate()
+
+    # A failed rebuild keeps the previously validated order
+    assert system.initialization_order() == [comp2, comp1]
+
+    system.system_map["comp3"].using(["comp1"])
+    comp2.using(["comp3"])
+    with pytest.raises(ValueError, match="Dependency graph has cycles"):
+        system.invalidate()
+
+    assert system.initialization_order() == [comp2, comp1]
+
+
+def test_system_initialization_order_without_dependencies():
+    """Test that components without dependencies keep system-map order."""
+    comp1 = MockLifecycleComponent("comp1")
+    comp2 = MockLifecycleComponent("comp2")
+
+    system = System({"comp1": comp1, "comp2": comp2})
+
+    assert system.initialization_order() == [comp1, comp2]
+    assert System({}).initialization_order() == []
+
+
+def test_system_runs_components_on_calling_thread_by_default():
+    """Test that without max_workers no worker threads are used."""
+    threads = []
+
+    class ThreadRecordingComponent(Component):
+        def start(self, system: Component):
+            threads.append(threading.current_thread())
+
+        def shutdown(self):
+            threads.append(threading.current_thread())
+
+    system = System(
+        {"comp1": ThreadRecordingComponent(), "comp2": ThreadRecordingComponent()}
+    )
+    system.start(system)
+    system.shutdown()
+
+    assert threads == [threading.current_thread()] * 4
+
+
+def test_system_rejects_invalid_max_workers():
+    """Test that max_workers must be a positive number of threads."""
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        System({}, max_workers=0)
+
+
+def test_system_starts_independent_components_concurrently():
+    """Test that independent components are started concurrently."""
+    # Both components wait on the barrier, so start() only succeeds
+    # if they run at the same time.
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierComponent(Component):
+        def start(self, system: Component):
+            barrier.wait()
+
+        def shutdown(self):
+            barrier.wait()
+
+    system = System(
+        {"comp1": BarrierComponent(), "comp2": BarrierComponent()}, max_workers=2
+    )
+    system.start(system)
+    system.shutdown()
+
+    assert system.state == "TERMINATED"
+
+
+def test_system_starts_components_once_their_dependencies_are_started():
+    """Test that a component does not wait for unrelated slower components."""
+    # comp1 only finishes starting once comp3 has started. comp3 depends on
+    # comp2 alone, so it must not wait for comp1 to finish.
+    comp3_started = threading.Event()
+
+    class SlowComponent(Component):
+        def start(self, system: Component):
+            assert comp3_started.wait(timeout=5)
+
+        def shutdown(self):
+            pass
+
+    class SignalComponent(MockLifecycleComponent):
+        def start(self, system: Component):
+            super().start(system)
+            comp3_started.set()
+
+    system = System(
+        {
+            "comp1": SlowComponent(),
+            "comp2": MockLifecycleComponent("comp2"),
+            "comp3": SignalComponent("comp3").using(["comp2"]),
+        },
+        max_workers=3,
+    )
+    system.start(system)
+
+    assert system.state == "STARTED"
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_system_start_propagates_component_error(max_workers):
+    """Test that an error raised by a component stops the system start."""
+
+    class FailingComponent(Component):
+        def start(self, system: Component):
+            raise RuntimeError("boom")
+
+        def shutdown(self):
+            pass
+
+    comp2 = MockLifecycleComponent("comp2").using(["comp1"])
+    system = System(
+        {"comp1": FailingComponent(), "comp2": comp2}, max_workers=max_workers
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        system.start(system)
+
+    assert comp2.started is False
+    assert system.state == "INITIALIZED"
+
+
+def test_system_sequential_shutdown_reverses_initialization_order():
+    """Test that a sequential shutdown runs exactly in reverse start order."""
+    shutdown_sequence = []
+
+    class OrderedComponent(Component):
+        def __init__(self, name: str):
+            super().__init__()
+            self.name = name
+
+        def start(self, system: Component):
+            pass
+
+        def shutdown(self):
+            shutdown_sequence.append(self)
+
+    system = System(
+        {
+            "comp1": OrderedComponent("comp1"),
+            "comp2": OrderedComponent("comp2"),
+            "comp3": OrderedComponent("comp3").using(["comp1"]),
+        }
+    )
+    system.start(system)
+    system.shutdown()
+
+    assert shutdown_sequence == list(reversed(system.initialization_order()))
+
+
+def test_system_component_registered_under_several_names():
+    """Test that a component aliased under two names is managed once."""
+
+    class CountingComponent(Component):
+        def __init__(self):
+            super().__init__()
+            self.start_calls = 0
+            self.shutdown_calls = 0
+
+        def start(self, system: Component):
+            self.start_calls += 1
+
+        def shutdown(self):
+            self.shutdown_calls += 1
+
+    db = CountingComponent()
+    api = MockLifecycleComponent("api").using(["db", "database"])
+    system = System({"db": db, "database": db, "api": api})
+
+    assert system.initialization_order() == [db, api]
+    assert system.system_map_to_graph() == {db: [], api: [db]}
+
+    system.start(system)
+    system.shutdown()
+
+    assert db.start_calls == 1
+    assert db.shutdown_calls == 1
+
+
+def test_system_start_error_stops_queued_independent_components():
+    """Test that independent components waiting for a worker are not started."""
+
+    class FailingComponent(Component):
+        def start(self, system: Component):
+            raise RuntimeError("boom")
+
+        def shutdown(self):
+            pass
+
+    class SlowComponent(MockLifecycleComponent):
+        def start(self, system: Component):
+            super().start(system)
+            # Keep the second worker busy while the failure is handled.
+            threading.Event().wait(timeout=0.5)
+
+    slow = SlowComponent("slow")
+    queued = [MockLifecycleComponent("queued1"), MockLifecycleComponent("queued2")]
+    system = System(
+        {
+            "failing": FailingComponent(),
+            "slow": slow,
+            "queued1": queued[0],
+            "queued2": queued[1],
+        },
+        max_workers=2,
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        system.start(system)
+
+    assert slow.started is True
+    assert not any(comp.started for comp in queued)
+
+
+def test_system_accepts_str_enum_names():
+    """Test that StrEnum members work as system-map keys and dependencies."""
+
+    class Names(StrEnum):
+        DB = "db"
+        API = "api"
+
+    db = MockLifecycleComponent("db")
+    api = MockLifecycleComponent("api").using([Names.DB])
+    system = System({Names.DB: db, Names.API: api})
+
+    assert system.initialization_order() == [db, api]
+
+    system.start(system)
+    assert db.started is True
+    assert api.started is True
+
+
 def test_system_missing_dependency():
-    """Test that missing dependencies raise a KeyError."""
+    """Test that missing dependencies raise a KeyError when the system is built."""
     comp1 = MockLifecycleComponent("comp1").using(["nonexistent"])
 
     system_map = {"comp1": comp1}
-    system = System(system_map)
 
     with pytest.raises(KeyError, match="Component dependency 'nonexistent' not found"):
-        system.start(system)
+        System(system_map)
 
 
 def test_system_circular_dependency():
-    """Test that circular dependencies are detected."""
+    """Test that circular dependencies are detected when the system is built."""
     # This would require modifying the system_map after component creation
     # to create a circular dependency
     comp1 = MockLifecycleComponent("comp1")
@@ -164,10 +448,22 @@ def test_system_circular_dependency():
     comp2.dependencies = ["comp1"]
 
     system_map = {"comp1": comp1, "comp2": comp2}
-    system = System(system_map)
 
     with pytest.raises(ValueError, match="Dependency graph has cycles"):
-        system.start(system)
+        System(system_map)
+
+
+def test_system_circular_dependency_behind_acyclic_components():
+    """Test that a cycle is detected even when other components are acyclic."""
+    comp1 = MockLifecycleComponent("comp1")
+    comp2 = MockLifecycleComponent("comp2").using(["comp1", "comp3"])
+    comp3 = MockLifecycleComponent("comp3").using(["comp2"])
+    comp4 = MockLifecycleComponent("comp4").using(["comp3"])
+
+    system_map = {"comp1": comp1, "comp2": comp2, "comp3": comp3, "comp4": comp4}
+
+    with pytest.raises(ValueError, match="Dependency graph has cycles"):
+        System(system_map)
 
 
 def test_system_complex_dependency_graph():